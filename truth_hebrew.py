@@ -7,68 +7,130 @@ Affiche les conversions, propriétés mathématiques, hashs, etc.
 import math
 import hashlib
 import base64
+import re
 import sys
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 
-# Alphabet hébreu complet
-ALPHABET_HEBREU = {
+# Alphabet hébreu complet (lecture seule : les tables dérivées sont construites à l'import)
+ALPHABET_HEBREU = MappingProxyType({
     'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5, 'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9, 'י': 10,
     'כ': 11, 'ל': 12, 'מ': 13, 'נ': 14, 'ס': 15, 'ע': 16, 'פ': 17, 'צ': 18, 'ק': 19, 'ר': 20,
     'ש': 21, 'ת': 22,
     # Formes finales
     'ך': 11, 'ם': 13, 'ן': 14, 'ף': 17, 'ץ': 18
-}
+})
 
-ALPHABET_INVERSE = {
-    1: 'א', 2: 'ב', 3: 'ג', 4: 'ד', 5: 'ה', 6: 'ו', 7: 'ז', 8: 'ח', 9: 'ט', 10: 'י',
-    11: 'כ', 12: 'ל', 13: 'מ', 14: 'נ', 15: 'ס', 16: 'ע', 17: 'פ', 18: 'צ', 19: 'ק', 20: 'ר',
-    21: 'ש', 22: 'ת'
-}
+# Formes finales et alphabet de base trié par valeur, pour l'affichage de la table
+_FINAL_FORMS = (('ך', 11), ('ם', 13), ('ן', 14), ('ף', 17), ('ץ', 18))
+_ALPHABET_UNIQUE_SORTED = tuple(sorted(
+    ((lettre, valeur) for lettre, valeur in ALPHABET_HEBREU.items() if lettre not in 'ךםןףץ'),
+    key=lambda x: x[1]
+))
+
+# Lettre de chaque valeur, indexée directement par la valeur (1 à 22)
+ALPHABET_INVERSE = (
+    '', 'א', 'ב', 'ג', 'ד', 'ה', 'ו', 'ז', 'ח', 'ט', 'י',
+    'כ', 'ל', 'מ', 'נ', 'ס', 'ע', 'פ', 'צ', 'ק', 'ר',
+    'ש', 'ת'
+)
+
+# Table plate des valeurs indexée par ord(lettre) - 0x5D0 (bloc hébreu)
+_DEBUT_HEBREU = 0x5D0
+_HEB_LUT = bytearray(64)
+for _lettre, _valeur in ALPHABET_HEBREU.items():
+    _HEB_LUT[ord(_lettre) - _DEBUT_HEBREU] = _valeur
+del _lettre, _valeur
+
+# (position dans le bloc, lettre) par valeur croissante, forme de base avant forme finale
+_ORDRE_LETTRES = tuple(
+    (ord(lettre) - _DEBUT_HEBREU, lettre)
+    for lettre in sorted(ALPHABET_HEBREU, key=ALPHABET_HEBREU.get)
+)
+
+def _val(lettre):
+    """Valeur d'une lettre hébraïque, 0 si ce n'en est pas une"""
+    o = ord(lettre) - _DEBUT_HEBREU
+    return _HEB_LUT[o] if 0 <= o < 64 else 0
+
+# Au-delà de cette longueur (seuil mesuré), les calculs passent par NumPy s'il est installé
+_SEUIL_NUMPY = 64
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Importe NumPy au premier mot long : (module, table par point de code), ou None"""
+    try:
+        import numpy as np
+    except ImportError:  # NumPy est optionnel
+        return None
+    # Même table que _HEB_LUT, indexée directement par point de code
+    lut = np.zeros(_DEBUT_HEBREU + 64, dtype=np.uint8)
+    lut[_DEBUT_HEBREU:] = np.frombuffer(_HEB_LUT, dtype=np.uint8)
+    return np, lut
+
+def _valeurs_np(mot):
+    """Valeurs des caractères du mot (0 hors alphabet) sous forme de tableau NumPy"""
+    charge = _numpy()
+    if charge is None:
+        raise ImportError("NumPy est requis pour ce calcul")
+    np, lut = charge
+    codes = np.frombuffer(mot.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    return np, lut[codes[codes < len(lut)]]
+
+class _TableTraduction(dict):
+    """Table pour str.translate, complétée à la demande pour les caractères absents"""
+
+    def __init__(self, table, defaut):
+        super().__init__(table)
+        self.defaut = defaut
+
+    def __missing__(self, code):
+        valeur = self[code] = self.defaut(chr(code))
+        return valeur
+
+def _code_latin(lettre):
+    """Code d'une lettre non hébraïque, ou None pour la supprimer"""
+    if lettre.isalpha():
+        return f"{ord(lettre.upper()) - ord('A') + 1}."
+    return None
+
+# Table de traduction construite une seule fois (boucle en C via str.translate)
+_TABLE_ENCODAGE = _TableTraduction(
+    {ord(lettre): f"{valeur}." for lettre, valeur in ALPHABET_HEBREU.items()},
+    _code_latin
+)
 
 def encoder_mot_hebreu(mot):
     """Encode un mot hébreu en séquence numérique"""
-    mot = mot.strip()
-    resultat = []
-    
-    for lettre in mot:
-        if lettre in ALPHABET_HEBREU:
-            numero = ALPHABET_HEBREU[lettre]
-            resultat.append(str(numero))
-        elif lettre.isalpha():
-            numero = ord(lettre.upper()) - ord('A') + 1
-            resultat.append(str(numero))
-    
-    return '.'.join(resultat)
+    return mot.translate(_TABLE_ENCODAGE).rstrip('.')
+
+# Séquence numérique à décoder : nombres séparés par des points
+_SEQUENCE_NUMERIQUE_RE = re.compile(r'\d+(?:\.\d+)*')
+
+# Caractère de chaque code : hébreu de 1 à 22, puis latin (W à Z) jusqu'à 26
+_DECODE_LUT = ALPHABET_INVERSE + tuple(chr(i + ord('A') - 1) for i in range(23, 27))
 
 def decoder_sequence_hebreu(sequence):
-    """Décode une séquence numérique en mot hébreu"""
-    nombres = sequence.split('.')
-    mot_decode = []
-    
-    for nombre in nombres:
-        if nombre.isdigit():
-            numero = int(nombre)
-            if 1 <= numero <= 22:
-                lettre = ALPHABET_INVERSE[numero]
-                mot_decode.append(lettre)
-            elif 1 <= numero <= 26:
-                lettre = chr(numero + ord('A') - 1)
-                mot_decode.append(lettre)
-    
-    return ''.join(mot_decode)
+    """Décode une séquence numérique en mot hébreu (éléments non numériques ignorés)"""
+    nombres = filter(str.isdecimal, sequence.split('.'))
+    return ''.join([_DECODE_LUT[n] for n in map(int, nombres) if 1 <= n <= 26])
 
 def mot_vers_nombre(mot):
     """Convertit un mot hébreu en nombre unique (somme des codes)"""
-    mot = mot.strip()
-    total = 0
-    
-    for lettre in mot:
-        if lettre in ALPHABET_HEBREU:
-            total += ALPHABET_HEBREU[lettre]
-    
-    return total
+    if len(mot) > _SEUIL_NUMPY and _numpy() is not None:
+        return mot_vers_nombre_np(mot)
+    lut = _HEB_LUT
+    return sum(lut[o] for o in (ord(c) - _DEBUT_HEBREU for c in mot) if 0 <= o < 64)
+
+def mot_vers_nombre_np(mot):
+    """Version vectorisée de mot_vers_nombre (nécessite NumPy)"""
+    _, valeurs = _valeurs_np(mot)
+    return int(valeurs.sum())
 
-def analyser_mot_hebreu(mot):
-    """Analyse complète d'un mot hébreu"""
+def analyser_mot_hebreu(mot, verify=False):
+    """Analyse complète d'un mot hébreu (verify ajoute le décodage de contrôle)"""
+    mot = mot.strip()
     results = {}
     
     # Informations de base
@@ -80,13 +142,14 @@ def analyser_mot_hebreu(mot):
     results['valeur_numerique'] = mot_vers_nombre(mot)
     
     # Décodage (pour vérification)
-    results['mot_decode'] = decoder_sequence_hebreu(results['sequence_hebreu'])
+    if verify:
+        results['mot_decode'] = decoder_sequence_hebreu(results['sequence_hebreu'])
     
     # Propriétés du texte
     results['est_palindrome'] = est_palindrome_hebreu(mot)
     results['nombre_lettres'] = compter_lettres_hebreu(mot)
     results['lettres_uniques'] = lettres_uniques_hebreu(mot)
-    results['gematria'] = calculer_gematria(mot)
+    results['valeur_simple'] = results['valeur_numerique']
     
     # Analyse numérique basée sur la valeur totale
     nombre = results['valeur_numerique']
@@ -94,58 +157,115 @@ def analyser_mot_hebreu(mot):
     
     return results
 
+# Toutes les propriétés dérivées d'un nombre, dans l'ordre des clés de analyser_nombre
+_ProprietesNombre = namedtuple('_ProprietesNombre', [
+    'decimal', 'hexadecimal', 'binary', 'octal',
+    'parity', 'factors', 'prime_status', 'digit_sum', 'digit_count',
+    'square', 'cube', 'square_root',
+    'md5', 'sha256', 'base64',
+    'signification_gematria',
+])
+
 def analyser_nombre(nombre):
     """Analyse complète d'un nombre"""
-    results = {}
-    
-    # Conversion de base
-    results['decimal'] = nombre
-    results['hexadecimal'] = hex(nombre)[2:].upper()
-    results['binary'] = bin(nombre)[2:]
-    results['octal'] = oct(nombre)[2:]
-    
-    # Propriétés mathématiques
-    results['parity'] = "אי-זוגי (Odd)" if nombre % 2 else "זוגי (Even)"
-    results['factors'] = factorize(nombre)
-    results['prime_status'] = "ראשוני (Prime)" if is_prime(nombre) else "מרוכב (Composite)"
-    results['digit_sum'] = sum(int(d) for d in str(nombre))
-    results['digit_count'] = len(str(nombre))
-    results['square'] = nombre ** 2
-    results['cube'] = nombre ** 3
-    if nombre >= 0:
-        results['square_root'] = math.sqrt(nombre)
-    else:
-        results['square_root'] = float('nan')
-    
-    # Hash et cryptographie
-    results['md5'] = hashlib.md5(str(nombre).encode()).hexdigest()
-    results['sha256'] = hashlib.sha256(str(nombre).encode()).hexdigest()
-    results['base64'] = base64.b64encode(str(nombre).encode()).decode()
-    
-    # Valeurs spéciales pour la culture hébraïque
-    results['valeur_gematria'] = nombre
-    results['signification_gematria'] = signification_gematria(nombre)
-    
+    results = _proprietes_nombre(nombre)._asdict()
+    results['factors'] = list(results['factors'])
     return results
 
+@lru_cache(maxsize=4096)
+def _proprietes_nombre(nombre):
+    """Cœur pur de analyser_nombre, calculé une fois par valeur"""
+    factors = _factoriser(nombre)
+    # Premier si la factorisation se réduit au nombre lui-même (pas de second passage)
+    premier = nombre >= 2 and len(factors) == 1 and factors[0] == nombre
+    digit_sum, digit_count = _statistiques_chiffres(nombre)
+    md5, sha256, b64 = _empreintes(nombre)
+    return _ProprietesNombre(
+        # Conversion de base
+        decimal=nombre,
+        hexadecimal=_HEX[nombre] if 0 <= nombre < len(_HEX) else format(nombre, 'X'),
+        binary=format(nombre, 'b'),
+        octal=format(nombre, 'o'),
+        # Propriétés mathématiques
+        parity="אי-זוגי (Odd)" if nombre % 2 else "זוגי (Even)",
+        factors=factors,
+        prime_status="ראשוני (Prime)" if premier else "מרוכב (Composite)",
+        digit_sum=digit_sum,
+        digit_count=digit_count,
+        square=nombre ** 2,
+        cube=nombre ** 3,
+        square_root=math.sqrt(nombre) if nombre >= 0 else float('nan'),
+        # Hash et cryptographie
+        md5=md5,
+        sha256=sha256,
+        base64=b64,
+        # Valeurs spéciales pour la culture hébraïque
+        signification_gematria=signification_gematria(nombre),
+    )
+
+def _statistiques_chiffres(nombre):
+    """Somme et nombre des chiffres décimaux, en un seul passage arithmétique"""
+    somme = 0
+    compte = 0
+    x = abs(nombre)
+    while x:
+        x, chiffre = divmod(x, 10)
+        somme += chiffre
+        compte += 1
+    return somme, compte or 1
+
+# Représentations hexadécimales précalculées pour les petites valeurs
+_HEX = tuple(format(i, 'X') for i in range(0x1000))
+
+def _empreintes(nombre):
+    """MD5, SHA-256 et Base64 de l'écriture décimale du nombre"""
+    octets = f"{nombre}".encode('ascii')
+    return (
+        hashlib.md5(octets).hexdigest(),
+        hashlib.sha256(octets).hexdigest(),
+        base64.b64encode(octets).decode('ascii')
+    )
+
 def est_palindrome_hebreu(mot):
     """Vérifie si le mot hébreu est un palindrome"""
-    mot = mot.strip()
-    mot_nettoye = ''.join(c for c in mot if c in ALPHABET_HEBREU)
-    return mot_nettoye == mot_nettoye[::-1]
+    # Deux indices qui se rejoignent en sautant les caractères non hébreux
+    lut = _HEB_LUT
+    i = 0
+    j = len(mot) - 1
+    while i < j:
+        oi = ord(mot[i]) - _DEBUT_HEBREU
+        if not (0 <= oi < 64 and lut[oi]):
+            i += 1
+            continue
+        oj = ord(mot[j]) - _DEBUT_HEBREU
+        if not (0 <= oj < 64 and lut[oj]):
+            j -= 1
+            continue
+        if mot[i] != mot[j]:
+            return False
+        i += 1
+        j -= 1
+    return True
 
 def compter_lettres_hebreu(mot):
     """Compte les lettres hébraïques dans le mot"""
-    return sum(1 for lettre in mot if lettre in ALPHABET_HEBREU)
+    if len(mot) > _SEUIL_NUMPY and _numpy() is not None:
+        np, valeurs = _valeurs_np(mot)
+        return int(np.count_nonzero(valeurs))
+    return sum(1 for lettre in mot if _val(lettre))
 
 def lettres_uniques_hebreu(mot):
     """Retourne les lettres hébraïques uniques du mot"""
-    lettres = [lettre for lettre in mot if lettre in ALPHABET_HEBREU]
-    return ''.join(sorted(set(lettres), key=lambda x: ALPHABET_HEBREU[x]))
+    # Un bit par position du bloc hébreu, puis lecture dans l'ordre des valeurs
+    masque = 0
+    for lettre in mot:
+        o = ord(lettre) - _DEBUT_HEBREU
+        if 0 <= o < 64 and _HEB_LUT[o]:
+            masque |= 1 << o
+    return ''.join(lettre for o, lettre in _ORDRE_LETTRES if masque >> o & 1)
 
 def calculer_gematria(mot):
     """Calcule la valeur Gematria complète"""
-    mot = mot.strip()
     valeur_simple = mot_vers_nombre(mot)
     
     # Calcul additionnel pour Gematria (vous pouvez ajouter d'autres méthodes)
@@ -155,180 +275,300 @@ def calculer_gematria(mot):
         'description': f"Gematria: {valeur_simple}"
     }
 
+# Significations Gematria connues (chaînes internées, partagées avec les résultats)
+_SIGNIFICATIONS = MappingProxyType({nombre: sys.intern(texte) for nombre, texte in {
+    1: "א - אחדות, אלוהים (Unité, Dieu)",
+    2: "ב - ברכה, בית (Bénédiction, Maison)",
+    3: "ג - גמול, גדולה (Récompense, Grandeur)",
+    4: "ד - דעת, דלת (Connaissance, Porte)",
+    5: "ה - הארה, חיים (Illumination, Vie)",
+    6: "ו - וודאות, connection (Certitude, Connection)",
+    7: "ז - זוהר, מזל (Brillance, Chance)",
+    8: "ח - חיים, חסד (Vie, Grâce)",
+    9: "ט - טוב, טהרה (Bonté, Pureté)",
+    10: "י - יד, יסוד (Main, Fondation)",
+    11: "כ - כוח, כבוד (Force, Honneur)",
+    12: "ל - לימוד, לב (Étude, Cœur)",
+    13: "מ - מים, מצוות (Eau, Commandements)",
+    14: "נ - נשמה, נצח (Âme, Éternité)",
+    15: "ס - סוד, סגולה (Secret, Vertu)",
+    16: "ע - עין, עולם (Œil, Monde)",
+    17: "פ - פה, פלא (Bouche, Merveille)",
+    18: "צ - צדק, צמח (Justice, Plante)",
+    19: "ק - קודש, קומה (Saint, Étage)",
+    20: "ר - רוח, רחמים (Esprit, Miséricorde)",
+    21: "ש - שלום, שמים (Paix, Cieux)",
+    22: "ת - תורה, תשובה (Torah, Repentir)",
+    26: "יהוה - Nom de Dieu",
+    32: "32 chemins de la sagesse",
+    42: "42 lettres du Nom Divin",
+    72: "72 noms de Dieu"
+}.items()})
+_SIGNIFICATION_PAR_DEFAUT = sys.intern("מספר כללי (Nombre général)")
+
 def signification_gematria(nombre):
     """Retourne la signification Gematria du nombre"""
-    significations = {
-        1: "א - אחדות, אלוהים (Unité, Dieu)",
-        2: "ב - ברכה, בית (Bénédiction, Maison)",
-        3: "ג - גמול, גדולה (Récompense, Grandeur)",
-        4: "ד - דעת, דלת (Connaissance, Porte)",
-        5: "ה - הארה, חיים (Illumination, Vie)",
-        6: "ו - וודאות, connection (Certitude, Connection)",
-        7: "ז - זוהר, מזל (Brillance, Chance)",
-        8: "ח - חיים, חסד (Vie, Grâce)",
-        9: "ט - טוב, טהרה (Bonté, Pureté)",
-        10: "י - יד, יסוד (Main, Fondation)",
-        11: "כ - כוח, כבוד (Force, Honneur)",
-        12: "ל - לימוד, לב (Étude, Cœur)",
-        13: "מ - מים, מצוות (Eau, Commandements)",
-        14: "נ - נשמה, נצח (Âme, Éternité)",
-        15: "ס - סוד, סגולה (Secret, Vertu)",
-        16: "ע - עין, עולם (Œil, Monde)",
-        17: "פ - פה, פלא (Bouche, Merveille)",
-        18: "צ - צדק, צמח (Justice, Plante)",
-        19: "ק - קודש, קומה (Saint, Étage)",
-        20: "ר - רוח, רחמים (Esprit, Miséricorde)",
-        21: "ש - שלום, שמים (Paix, Cieux)",
-        22: "ת - תורה, תשובה (Torah, Repentir)",
-        26: "יהוה - Nom de Dieu",
-        32: "32 chemins de la sagesse",
-        42: "42 lettres du Nom Divin",
-        72: "72 noms de Dieu"
-    }
-    
-    return significations.get(nombre, "מספר כללי (Nombre général)")
+    return _SIGNIFICATIONS.get(nombre, _SIGNIFICATION_PAR_DEFAUT)
+
+# Écarts de la roue 2·3·5 : à partir de 7, saute les multiples de 2, 3 et 5
+_ROUE = (4, 2, 4, 2, 4, 6, 2, 6)
+# Entre ces bornes les noyaux Numba sont utilisés : en dessous, le crible en Python pur
+# l'emporte sur le coût d'import et de compilation ; au-delà, risque de dépassement int64
+_SEUIL_JIT = 10 ** 10
+_LIMITE_JIT = 2 ** 62
+
+# Petits premiers (crible d'Ératosthène), testés avant la boucle 6k±1
+_BORNE_CRIBLE = 10000
+_crible = bytearray([1]) * _BORNE_CRIBLE
+_crible[0] = _crible[1] = 0
+for _p in range(2, math.isqrt(_BORNE_CRIBLE - 1) + 1):
+    if _crible[_p]:
+        _crible[_p * _p::_p] = bytes(len(range(_p * _p, _BORNE_CRIBLE, _p)))
+_PETITS_PREMIERS = tuple(i for i, premier in enumerate(_crible) if premier)
+del _crible, _p
+# Premier 6k-1 au-delà du crible
+_DEBUT_6K = (_BORNE_CRIBLE // 6 + 1) * 6 - 1
+
+def _est_premier_py(n):
+    """Test de primalité : petits premiers puis divisions par 6k±1"""
+    if n < 2:
+        return False
+    for p in _PETITS_PREMIERS:
+        if p * p > n:
+            return True
+        if n % p == 0:
+            return n == p
+    i = _DEBUT_6K
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+        i += 6
+    return True
+
+def _est_premier_roue(n):
+    """Test de primalité par divisions successives sur la roue 2·3·5"""
+    if n < 2:
+        return False
+    for p in (2, 3, 5):
+        if n % p == 0:
+            return n == p
+    d = 7
+    i = 0
+    while d * d <= n:
+        if n % d == 0:
+            return False
+        d += _ROUE[i]
+        i = (i + 1) & 7
+    return True
+
+@lru_cache(maxsize=None)
+def _noyaux_jit():
+    """Compile au premier grand nombre les noyaux Numba, ou None si Numba est absent"""
+    try:
+        from numba import njit
+        import numpy as np
+    except ImportError:  # Numba est optionnel
+        return None
+
+    est_premier = njit('boolean(int64)', cache=True)(_est_premier_roue)
+
+    @njit('int64[:](int64)', cache=True)
+    def factoriser(n):
+        """Factorisation compilée, n >= 2 (au plus 63 facteurs en int64)"""
+        facteurs = np.empty(64, dtype=np.int64)
+        k = 0
+        for p in (2, 3, 5):
+            while n % p == 0:
+                facteurs[k] = p
+                k += 1
+                n //= p
+        d = 7
+        i = 0
+        while d * d <= n:
+            while n % d == 0:
+                facteurs[k] = d
+                k += 1
+                n //= d
+            d += _ROUE[i]
+            i = (i + 1) & 7
+        if n > 1:
+            facteurs[k] = n
+            k += 1
+        return facteurs[:k]
+
+    return est_premier, factoriser
 
 def factorize(n):
     """Factorise un nombre"""
+    return list(_factoriser(n))
+
+@lru_cache(maxsize=65536)
+def _factoriser(n):
+    """Facteurs premiers de n sous forme de tuple (mis en cache)"""
     if n < 2:
-        return [n]
+        return (n,)
+    if _SEUIL_JIT < n < _LIMITE_JIT:
+        noyaux = _noyaux_jit()
+        if noyaux is not None:
+            return tuple(noyaux[1](n).tolist())
     
     factors = []
-    d = 2
-    while d * d <= n:
-        while n % d == 0:
-            factors.append(d)
-            n //= d
-        d += 1
+    for p in _PETITS_PREMIERS:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    else:
+        d = _DEBUT_6K
+        while d * d <= n:
+            for q in (d, d + 2):
+                while n % q == 0:
+                    factors.append(q)
+                    n //= q
+            d += 6
     if n > 1:
         factors.append(n)
-    return factors
+    return tuple(factors)
 
+@lru_cache(maxsize=65536)
 def is_prime(n):
     """Vérifie si un nombre est premier"""
-    if n < 2:
-        return False
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
-            return False
-    return True
+    if _SEUIL_JIT < n < _LIMITE_JIT:
+        noyaux = _noyaux_jit()
+        if noyaux is not None:
+            return noyaux[0](n)
+    return _est_premier_py(n)
 
 def afficher_table_hebreu():
     """Affiche la table de correspondance hébraïque"""
-    print("\n" + "="*70)
-    print("טבלת התאמות אלפבית עברי מלאה")
-    print("Complete Hebrew Alphabet Correspondence Table")
-    print("="*70)
-    
-    alphabet = list(ALPHABET_HEBREU.items())
-    # Trier par valeur numérique (sans doublons pour les formes finales)
-    alphabet_unique = []
-    valeurs_vues = set()
-    for lettre, valeur in alphabet:
-        if valeur not in valeurs_vues:
-            alphabet_unique.append((lettre, valeur))
-            valeurs_vues.add(valeur)
+    lignes = []
+    lignes.append("\n" + "="*70)
+    lignes.append("טבלת התאמות אלפבית עברי מלאה")
+    lignes.append("Complete Hebrew Alphabet Correspondence Table")
+    lignes.append("="*70)
     
-    alphabet_unique.sort(key=lambda x: x[1])
+    alphabet_unique = _ALPHABET_UNIQUE_SORTED
     
-    print("אלפבית בסיסי (Basic Alphabet):")
+    lignes.append("אלפבית בסיסי (Basic Alphabet):")
     for i in range(0, len(alphabet_unique), 5):
         ligne = alphabet_unique[i:i+5]
-        for lettre, num in ligne:
-            print(f"{lettre}={num:2d}", end="  ")
-        print()
+        lignes.append(''.join(f"{lettre}={num:2d}  " for lettre, num in ligne))
     
-    print("\nצורות סופיות (Final Forms):")
-    final_forms = [('ך', 11), ('ם', 13), ('ן', 14), ('ף', 17), ('ץ', 18)]
-    for lettre, num in final_forms:
-        print(f"{lettre}={num:2d}", end="  ")
-    print()
+    lignes.append("\nצורות סופיות (Final Forms):")
+    lignes.append(''.join(f"{lettre}={num:2d}  " for lettre, num in _FINAL_FORMS))
+    
+    # Une seule écriture pour toute la table
+    sys.stdout.write('\n'.join(lignes) + '\n')
 
 def afficher_resultats(results):
     """Affiche les résultats de manière formatée"""
-    print("="*80)
-    print(f"ניתוח מלא של המילה העברית: '{results['mot_original']}'")
-    print(f"COMPLETE ANALYSIS OF HEBREW WORD: '{results['mot_original']}'")
-    print("="*80)
-    
-    print("\nמידע כללי (General Information)")
-    print(f"    המילה המקורית : {results['mot_original']}")
-    print(f"    אורך המילה : {results['longueur_mot']} תווים")
-    print(f"    האם פלינדרום? : {'כן (Yes)' if results['est_palindrome'] else 'לא (No)'}")
-    
-    print("\nקידוד עברי (Hebrew Encoding)")
-    print(f"    רצף מספרי : {results['sequence_hebreu']}")
-    print(f"    מילה מפוענחת (לאימות) : {results['mot_decode']}")
-    print(f"    ערך מספרי כולל : {results['valeur_numerique']}")
-    
-    print("\nגימטריה (Gematria)")
-    print(f"    ערך גימטריה : {results['gematria']['valeur_simple']}")
-    print(f"    משמעות : {results['signification_gematria']}")
-    
-    print("\nניתוח מספרי של הערך הכולל (Numeric Analysis)")
-    print(f"    עשרוני : {results['decimal']}")
-    print(f"    hexadecimal : {results['hexadecimal']}")
-    print(f"    בינארי : {results['binary']}")
-    print(f"    octal : {results['octal']}")
-    
-    print(f"\n    זוגיות : {results['parity']}")
-    print(f"    גורמים : {', '.join(map(str, results['factors']))}")
-    print(f"    ראשוני או מרוכב : {results['prime_status']}")
-    print(f"    סכום ספרות : {results['digit_sum']}")
-    
-    print(f"\n    ריבוע : {results['square']}")
-    print(f"    קובייה : {results['cube']}")
+    lignes = []
+    lignes.append("="*80)
+    lignes.append(f"ניתוח מלא של המילה העברית: '{results['mot_original']}'")
+    lignes.append(f"COMPLETE ANALYSIS OF HEBREW WORD: '{results['mot_original']}'")
+    lignes.append("="*80)
+    
+    lignes.append("\nמידע כללי (General Information)")
+    lignes.append(f"    המילה המקורית : {results['mot_original']}")
+    lignes.append(f"    אורך המילה : {results['longueur_mot']} תווים")
+    lignes.append(f"    האם פלינדרום? : {'כן (Yes)' if results['est_palindrome'] else 'לא (No)'}")
+    
+    lignes.append("\nקידוד עברי (Hebrew Encoding)")
+    lignes.append(f"    רצף מספרי : {results['sequence_hebreu']}")
+    if 'mot_decode' in results:
+        lignes.append(f"    מילה מפוענחת (לאימות) : {results['mot_decode']}")
+    lignes.append(f"    ערך מספרי כולל : {results['valeur_numerique']}")
+    
+    lignes.append("\nגימטריה (Gematria)")
+    lignes.append(f"    ערך גימטריה : {results['valeur_simple']}")
+    lignes.append(f"    משמעות : {results['signification_gematria']}")
+    
+    lignes.append("\nניתוח מספרי של הערך הכולל (Numeric Analysis)")
+    lignes.append(f"    עשרוני : {results['decimal']}")
+    lignes.append(f"    hexadecimal : {results['hexadecimal']}")
+    lignes.append(f"    בינארי : {results['binary']}")
+    lignes.append(f"    octal : {results['octal']}")
+    
+    lignes.append(f"\n    זוגיות : {results['parity']}")
+    lignes.append(f"    גורמים : {', '.join(map(str, results['factors']))}")
+    lignes.append(f"    ראשוני או מרוכב : {results['prime_status']}")
+    lignes.append(f"    סכום ספרות : {results['digit_sum']}")
+    
+    lignes.append(f"\n    ריבוע : {results['square']}")
+    lignes.append(f"    קובייה : {results['cube']}")
     if not math.isnan(results['square_root']):
-        print(f"    שורש ריבועי : {results['square_root']:.4f}")
+        lignes.append(f"    שורש ריבועי : {results['square_root']:.4f}")
     
-    print("\nהצפנה וחתימות (Encryption & Hashing)")
-    print(f"    MD5 : {results['md5']}")
-    print(f"    SHA-256 : {results['sha256']}")
-    print(f"    Base64 : {results['base64']}")
+    lignes.append("\nהצפנה וחתימות (Encryption & Hashing)")
+    lignes.append(f"    MD5 : {results['md5']}")
+    lignes.append(f"    SHA-256 : {results['sha256']}")
+    lignes.append(f"    Base64 : {results['base64']}")
     
     # Affichage détaillé de l'encodage
-    print("\nפירוט קידוד אות-אות (Encoding Details Letter by Letter)")
+    lignes.append("\nפירוט קידוד אות-אות (Encoding Details Letter by Letter)")
     mot = results['mot_original']
     for i, lettre in enumerate(mot):
-        if lettre in ALPHABET_HEBREU:
-            code = ALPHABET_HEBREU[lettre]
+        code = _val(lettre)
+        if code:
             nom_lettre = nom_lettre_hebreu(lettre)
-            print(f"    {i+1:2d}. {lettre} ({nom_lettre}) = {code:2d}")
+            lignes.append(f"    {i+1:2d}. {lettre} ({nom_lettre}) = {code:2d}")
         elif lettre.isalpha():
             code = ord(lettre.upper()) - ord('A') + 1
-            print(f"    {i+1:2d}. {lettre} (לטיני/latin) = {code:2d}")
+            lignes.append(f"    {i+1:2d}. {lettre} (לטיני/latin) = {code:2d}")
+    
+    # Une seule écriture pour tout le rapport
+    sys.stdout.write('\n'.join(lignes) + '\n')
+
+# Noms des lettres
+_NOMS_LETTRES = MappingProxyType({
+    'א': 'Aleph', 'ב': 'Bet', 'ג': 'Gimel', 'ד': 'Dalet', 'ה': 'He',
+    'ו': 'Vav', 'ז': 'Zayin', 'ח': 'Chet', 'ט': 'Tet', 'י': 'Yod',
+    'כ': 'Kaf', 'ל': 'Lamed', 'מ': 'Mem', 'נ': 'Nun', 'ס': 'Samech',
+    'ע': 'Ayin', 'פ': 'Pe', 'צ': 'Tsadi', 'ק': 'Kof', 'ר': 'Resh',
+    'ש': 'Shin', 'ת': 'Tav',
+    'ך': 'Kaf Sofit', 'ם': 'Mem Sofit', 'ן': 'Nun Sofit', 
+    'ף': 'Pe Sofit', 'ץ': 'Tsadi Sofit'
+})
+
+# Mêmes noms, indexés par ord(lettre) - 0x5D0 comme _HEB_LUT
+_NOMS = [None] * 64
+for _lettre, _nom in _NOMS_LETTRES.items():
+    _NOMS[ord(_lettre) - _DEBUT_HEBREU] = _nom
+_NOMS = tuple(_NOMS)
+del _lettre, _nom
 
 def nom_lettre_hebreu(lettre):
     """Retourne le nom de la lettre hébraïque"""
-    noms = {
-        'א': 'Aleph', 'ב': 'Bet', 'ג': 'Gimel', 'ד': 'Dalet', 'ה': 'He',
-        'ו': 'Vav', 'ז': 'Zayin', 'ח': 'Chet', 'ט': 'Tet', 'י': 'Yod',
-        'כ': 'Kaf', 'ל': 'Lamed', 'מ': 'Mem', 'נ': 'Nun', 'ס': 'Samech',
-        'ע': 'Ayin', 'פ': 'Pe', 'צ': 'Tsadi', 'ק': 'Kof', 'ר': 'Resh',
-        'ש': 'Shin', 'ת': 'Tav',
-        'ך': 'Kaf Sofit', 'ם': 'Mem Sofit', 'ן': 'Nun Sofit', 
-        'ף': 'Pe Sofit', 'ץ': 'Tsadi Sofit'
-    }
-    return noms.get(lettre, '?')
+    try:
+        o = ord(lettre) - _DEBUT_HEBREU
+    except TypeError:  # pas un caractère unique
+        return '?'
+    return _NOMS[o] if 0 <= o < 64 and _NOMS[o] else '?'
 
 def main():
-    if len(sys.argv) != 2:
-        print("שימוש: python truth_hebrew.py <מילה_עברית>")
-        print("Usage: python truth_hebrew.py <hebrew_word>")
+    args = sys.argv[1:]
+    verifier = '--verify' in args
+    if verifier:
+        args.remove('--verify')
+    
+    if len(args) != 1:
+        print("שימוש: python truth_hebrew.py <מילה_עברית> [--verify]")
+        print("Usage: python truth_hebrew.py <hebrew_word> [--verify]")
         print("דוגמה: python truth_hebrew.py שלום")
         print("דוגמה: python truth_hebrew.py \"21.12.6.13\" (לפענוח)")
         sys.exit(1)
     
-    entree = sys.argv[1].strip()
+    entree = args[0].strip()
     
     try:
         # Vérifier si c'est une séquence numérique
-        if '.' in entree and all(part.isdigit() for part in entree.split('.')):
+        if '.' in entree and _SEQUENCE_NUMERIQUE_RE.fullmatch(entree):
             mot_decode = decoder_sequence_hebreu(entree)
             print(f"🔓 רצף מפוענח : {entree} → {mot_decode}")
-            results = analyser_mot_hebreu(mot_decode)
+            results = analyser_mot_hebreu(mot_decode, verify=verifier)
         else:
-            results = analyser_mot_hebreu(entree)
+            results = analyser_mot_hebreu(entree, verify=verifier)
         
         afficher_resultats(results)
         afficher_table_hebreu()